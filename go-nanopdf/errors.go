@@ -1,10 +1,7 @@
 // Package nanopdf provides error types matching the Rust nanopdf library.
 package nanopdf
 
-import (
-	"errors"
-	"fmt"
-)
+import "errors"
 
 // ErrorCode represents the type of error that occurred.
 type ErrorCode int
@@ -26,25 +23,39 @@ const (
 	ErrCodeUnsupported
 )
 
+// errorCodeNames maps each ErrorCode to its name.
+var errorCodeNames = [...]string{
+	ErrCodeGeneric:     "GENERIC",
+	ErrCodeSystem:      "SYSTEM",
+	ErrCodeFormat:      "FORMAT",
+	ErrCodeEOF:         "EOF",
+	ErrCodeArgument:    "ARGUMENT",
+	ErrCodeLimit:       "LIMIT",
+	ErrCodeUnsupported: "UNSUPPORTED",
+}
+
+// errorPrefixes holds the "[NAME] " message prefix for each ErrorCode, built
+// once so formatting an error is plain string concatenation.
+var errorPrefixes = func() (prefixes [len(errorCodeNames)]string) {
+	for code, name := range errorCodeNames {
+		prefixes[code] = "[" + name + "] "
+	}
+	return prefixes
+}()
+
 func (c ErrorCode) String() string {
-	switch c {
-	case ErrCodeGeneric:
-		return "GENERIC"
-	case ErrCodeSystem:
-		return "SYSTEM"
-	case ErrCodeFormat:
-		return "FORMAT"
-	case ErrCodeEOF:
-		return "EOF"
-	case ErrCodeArgument:
-		return "ARGUMENT"
-	case ErrCodeLimit:
-		return "LIMIT"
-	case ErrCodeUnsupported:
-		return "UNSUPPORTED"
-	default:
-		return "UNKNOWN"
+	if c >= 0 && int(c) < len(errorCodeNames) {
+		return errorCodeNames[c]
+	}
+	return "UNKNOWN"
+}
+
+// prefix returns the "[NAME] " prefix used in error messages.
+func (c ErrorCode) prefix() string {
+	if c >= 0 && int(c) < len(errorPrefixes) {
+		return errorPrefixes[c]
 	}
+	return "[UNKNOWN] "
 }
 
 // NanoPDFError represents an error from the nanopdf library.
@@ -57,9 +68,9 @@ type NanoPDFError struct {
 // Error implements the error interface.
 func (e *NanoPDFError) Error() string {
 	if e.Cause != nil {
-		return fmt.Sprintf("[%s] %s: %v", e.Code, e.Message, e.Cause)
+		return e.Code.prefix() + e.Message + ": " + e.Cause.Error()
 	}
-	return fmt.Sprintf("[%s] %s", e.Code, e.Message)
+	return e.Code.prefix() + e.Message
 }
 
 // Unwrap returns the underlying cause of the error.
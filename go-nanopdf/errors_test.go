@@ -0,0 +1,41 @@
+package nanopdf
+
+import (
+	"errors"
+	"testing"
+)
+
+func TestNanoPDFError(t *testing.T) {
+	t.Run("Error", func(t *testing.T) {
+		err := ErrFormat("bad xref")
+		if got := err.Error(); got != "[FORMAT] bad xref" {
+			t.Errorf("unexpected message %q", got)
+		}
+	})
+
+	t.Run("ErrorWithCause", func(t *testing.T) {
+		err := ErrSystem("read failed", errors.New("disk gone"))
+		if got := err.Error(); got != "[SYSTEM] read failed: disk gone" {
+			t.Errorf("unexpected message %q", got)
+		}
+	})
+
+	t.Run("UnknownCode", func(t *testing.T) {
+		err := NewError(ErrorCode(99), "odd")
+		if got := err.Error(); got != "[UNKNOWN] odd" {
+			t.Errorf("unexpected message %q", got)
+		}
+		if ErrorCode(-1).String() != "UNKNOWN" {
+			t.Error("expected UNKNOWN for negative code")
+		}
+	})
+
+	t.Run("Is", func(t *testing.T) {
+		if !errors.Is(ErrArgument("x"), ErrNilPointer) {
+			t.Error("expected errors with the same code to match")
+		}
+		if errors.Is(ErrLimit("x"), ErrNilPointer) {
+			t.Error("expected errors with different codes not to match")
+		}
+	})
+}
@@ -40,9 +40,9 @@ func (p Point) Scale(factor float32) Point {
 
 // Distance calculates the distance to another point.
 func (p Point) Distance(other Point) float32 {
-	dx := p.X - other.X
-	dy := p.Y - other.Y
-	return float32(math.Sqrt(float64(dx*dx + dy*dy)))
+	dx := float64(p.X) - float64(other.X)
+	dy := float64(p.Y) - float64(other.Y)
+	return float32(math.Hypot(dx, dy))
 }
 
 // Equals checks if two points are equal.
@@ -289,17 +289,17 @@ func (m Matrix) TransformPoint(p Point) Point {
 
 // TransformRect transforms a rectangle by this matrix.
 func (m Matrix) TransformRect(r Rect) Rect {
-	// Transform all four corners and compute bounding box
-	p1 := Point{r.X0, r.Y0}.Transform(m)
-	p2 := Point{r.X1, r.Y0}.Transform(m)
-	p3 := Point{r.X0, r.Y1}.Transform(m)
-	p4 := Point{r.X1, r.Y1}.Transform(m)
+	// Transform all four corners, sharing the per-coordinate products
+	ax0, ax1, bx0, bx1 := r.X0*m.A, r.X1*m.A, r.X0*m.B, r.X1*m.B
+	cy0, cy1, dy0, dy1 := r.Y0*m.C, r.Y1*m.C, r.Y0*m.D, r.Y1*m.D
+	x1, x2, x3, x4 := ax0+cy0+m.E, ax1+cy0+m.E, ax0+cy1+m.E, ax1+cy1+m.E
+	y1, y2, y3, y4 := bx0+dy0+m.F, bx1+dy0+m.F, bx0+dy1+m.F, bx1+dy1+m.F
 
 	return Rect{
-		X0: min32(min32(p1.X, p2.X), min32(p3.X, p4.X)),
-		Y0: min32(min32(p1.Y, p2.Y), min32(p3.Y, p4.Y)),
-		X1: max32(max32(p1.X, p2.X), max32(p3.X, p4.X)),
-		Y1: max32(max32(p1.Y, p2.Y), max32(p3.Y, p4.Y)),
+		X0: min32(min32(x1, x2), min32(x3, x4)),
+		Y0: min32(min32(y1, y2), min32(y3, y4)),
+		X1: max32(max32(x1, x2), max32(x3, x4)),
+		Y1: max32(max32(y1, y2), max32(y3, y4)),
 	}
 }
 
@@ -54,6 +54,16 @@ func TestPoint(t *testing.T) {
 		}
 	})
 
+	t.Run("DistanceLargeCoordinates", func(t *testing.T) {
+		// dx*dx overflows float32 here; the result must still be finite
+		p1 := NewPoint(-3e20, 0)
+		p2 := NewPoint(3e20, 0)
+		d := p1.Distance(p2)
+		if math.IsInf(float64(d), 0) || math.Abs(float64(d)-6e20) > 1e14 {
+			t.Errorf("expected 6e20, got %g", d)
+		}
+	})
+
 	t.Run("Transform", func(t *testing.T) {
 		p := NewPoint(10, 20)
 		m := MatrixTranslate(5, 10)
@@ -172,6 +182,17 @@ func TestMatrix(t *testing.T) {
 			t.Errorf("expected (20, 0), got (%f, %f)", p.X, p.Y)
 		}
 	})
+
+	t.Run("TransformRect", func(t *testing.T) {
+		// Rotate 90 degrees then translate: (x, y) -> (-y+10, x+20)
+		m := MatrixRotate(90).PostTranslate(10, 20)
+		r := m.TransformRect(NewRect(0, 0, 100, 50))
+		want := NewRect(-40, 20, 10, 120)
+		if math.Abs(float64(r.X0-want.X0)) > 0.001 || math.Abs(float64(r.Y0-want.Y0)) > 0.001 ||
+			math.Abs(float64(r.X1-want.X1)) > 0.001 || math.Abs(float64(r.Y1-want.Y1)) > 0.001 {
+			t.Errorf("expected %v, got %v", want, r)
+		}
+	})
 }
 
 func TestQuad(t *testing.T) {
@@ -124,8 +124,7 @@ export class Page {
     alpha: boolean = true
   ): Pixmap {
     // Calculate transformed bounds
-    const m = Matrix.from(matrix);
-    const transformedBounds = this._bounds.transform(m);
+    const transformedBounds = this._bounds.transform(matrix);
 
     const width = Math.ceil(transformedBounds.width);
     const height = Math.ceil(transformedBounds.height);
@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { Point, Rect, Matrix, Quad } from './geometry.js';
+import { Point, Rect, Matrix, Quad, RectArray, transformRects } from './geometry.js';
 
 describe('Point', () => {
   it('should create a point', () => {
@@ -100,6 +100,21 @@ describe('Rect', () => {
     expect(result.y1).toBe(50);
   });
 
+  it('should return EMPTY for disjoint rects', () => {
+    const r1 = new Rect(0, 0, 10, 10);
+    const r2 = new Rect(20, 20, 30, 30);
+    expect(r1.intersect(r2)).toBe(Rect.EMPTY);
+  });
+
+  it('should transform to the bounding box of the transformed corners', () => {
+    const r = new Rect(0, 0, 100, 50);
+    const result = r.transform(Matrix.rotate(90).postTranslate(10, 20));
+    expect(result.x0).toBeCloseTo(-40);
+    expect(result.y0).toBeCloseTo(20);
+    expect(result.x1).toBeCloseTo(10);
+    expect(result.y1).toBeCloseTo(120);
+  });
+
   it('should create from XYWH', () => {
     const r = Rect.fromXYWH(10, 20, 100, 200);
     expect(r.x0).toBe(10);
@@ -138,6 +153,40 @@ describe('Matrix', () => {
     expect(Math.abs(m.b - 1)).toBeLessThan(0.0001); // sin(90) ≈ 1
   });
 
+  it('should share the identity instance for identity transforms', () => {
+    expect(Matrix.translate(0, 0)).toBe(Matrix.IDENTITY);
+    expect(Matrix.scale(1)).toBe(Matrix.IDENTITY);
+    expect(Matrix.rotate(0)).toBe(Matrix.IDENTITY);
+    expect(Matrix.rotate(360)).toBe(Matrix.IDENTITY);
+    expect(Matrix.shear(0, 0)).toBe(Matrix.IDENTITY);
+  });
+
+  it('should short-circuit concatenation with identity', () => {
+    const m = Matrix.translate(10, 20);
+    expect(m.concat(Matrix.IDENTITY)).toBe(m);
+    expect(Matrix.IDENTITY.concat(m)).toBe(m);
+  });
+
+  it('should memoize the inverse', () => {
+    const m = Matrix.scale(2, 4).postTranslate(10, 20);
+    const inv = m.invert()!;
+    expect(m.invert()).toBe(inv);
+    const p = new Point(3, 5).transform(m).transform(inv);
+    expect(p.x).toBeCloseTo(3);
+    expect(p.y).toBeCloseTo(5);
+    expect(Matrix.scale(0, 1).invert()).toBeNull();
+  });
+
+  it('should serialize as plain data after invert', () => {
+    const m = Matrix.translate(10, 20);
+    const copy = new Matrix(1, 0, 0, 1, 10, 20);
+    m.invert();
+    Matrix.IDENTITY.invert();
+    expect(JSON.stringify(m)).toBe(JSON.stringify(copy));
+    expect(JSON.stringify(Matrix.IDENTITY)).toBe('{"a":1,"b":0,"c":0,"d":1,"e":0,"f":0}');
+    expect(m).toEqual(copy);
+  });
+
   it('should concatenate matrices', () => {
     const t = Matrix.translate(10, 0);
     const s = Matrix.scale(2, 2);
@@ -179,5 +228,118 @@ describe('Quad', () => {
     expect(bounds.width).toBe(100);
     expect(bounds.height).toBe(100);
   });
+
+  it('should reuse the source rect as bounds', () => {
+    const r = new Rect(10, 20, 110, 70);
+    expect(Quad.fromRect(r).bounds).toBe(r);
+    const plain = Quad.fromRect({ x0: 10, y0: 20, x1: 110, y1: 70 });
+    expect(plain.bounds.equals(r)).toBe(true);
+  });
+
+  it('should keep cached bounds out of the instance', () => {
+    const r = new Rect(0, 0, 100, 50);
+    const fromRect = Quad.fromRect(r);
+    const built = new Quad(
+      new Point(0, 0),
+      new Point(100, 0),
+      new Point(0, 50),
+      new Point(100, 50)
+    );
+    expect(fromRect.bounds).toBe(r);
+    expect(fromRect).toEqual(built);
+    expect(JSON.stringify(fromRect)).toBe(JSON.stringify(built));
+  });
+
+  it('should compute bounds of a quad from an inverted rect', () => {
+    const q = Quad.fromRect({ x0: 10, y0: 10, x1: 0, y1: 0 });
+    expect(q.bounds.equals(new Rect(0, 0, 10, 10))).toBe(true);
+  });
+
+  it('should check contains', () => {
+    const q = Quad.fromRect(new Rect(0, 0, 100, 100));
+    expect(q.containsPoint({ x: 50, y: 50 })).toBe(true);
+    expect(q.containsPoint({ x: 150, y: 50 })).toBe(false);
+  });
+
+  it('should check validity', () => {
+    expect(Quad.fromRect(new Rect(0, 0, 100, 100)).isValid).toBe(true);
+    const bowtie = new Quad(
+      new Point(0, 0),
+      new Point(100, 0),
+      new Point(100, 100),
+      new Point(0, 100)
+    );
+    expect(bowtie.isValid).toBe(false);
+  });
 });
 
+describe('transformRects', () => {
+  it('should match Rect.transform for each rect', () => {
+    const rects = new Float32Array([0, 0, 100, 50, 10, 20, 30, 40]);
+    const m = Matrix.rotate(90).postTranslate(10, 20);
+    const result = transformRects(rects, m);
+    for (let i = 0; i < rects.length; i += 4) {
+      const r = new Rect(rects[i]!, rects[i + 1]!, rects[i + 2]!, rects[i + 3]!);
+      const expected = r.transform(m);
+      expect(result[i]).toBeCloseTo(expected.x0);
+      expect(result[i + 1]).toBeCloseTo(expected.y0);
+      expect(result[i + 2]).toBeCloseTo(expected.x1);
+      expect(result[i + 3]).toBeCloseTo(expected.y1);
+    }
+  });
+
+  it('should leave empty rects unchanged', () => {
+    const rects = new Float32Array([10, 10, 5, 5]);
+    const result = transformRects(rects, Matrix.translate(100, 100));
+    expect(Array.from(result)).toEqual([10, 10, 5, 5]);
+  });
+
+  it('should transform in place', () => {
+    const rects = new Float32Array([0, 0, 10, 10]);
+    const result = transformRects(rects, Matrix.scale(2), rects);
+    expect(result).toBe(rects);
+    expect(Array.from(rects)).toEqual([0, 0, 20, 20]);
+  });
+
+  it('should reject a length that is not a multiple of 4', () => {
+    expect(() => transformRects(new Float32Array(3), Matrix.IDENTITY)).toThrow();
+  });
+});
+
+describe('RectArray', () => {
+  it('should pack and read back rects', () => {
+    const arr = RectArray.from([new Rect(0, 0, 10, 20), { x0: 5, y0: 5, x1: 15, y1: 25 }]);
+    expect(arr.length).toBe(2);
+    expect(arr.data.length).toBe(8);
+    expect(arr.get(1).equals(new Rect(5, 5, 15, 25))).toBe(true);
+    expect(arr.toArray()).toHaveLength(2);
+    expect([...arr][0]!.equals(new Rect(0, 0, 10, 20))).toBe(true);
+  });
+
+  it('should reject out of bounds indices', () => {
+    const arr = RectArray.from([Rect.UNIT]);
+    expect(() => arr.get(1)).toThrow();
+    expect(() => arr.get(-1)).toThrow();
+  });
+
+  it('should calculate bounds', () => {
+    const arr = RectArray.from([new Rect(0, 0, 10, 20), new Rect(5, -5, 15, 10)]);
+    expect(arr.bounds.equals(new Rect(0, -5, 15, 20))).toBe(true);
+    expect(new RectArray(new Float32Array(0)).bounds).toBe(Rect.EMPTY);
+  });
+
+  it('should skip empty rects in bounds like Rect.union', () => {
+    const rects = [new Rect(0, 0, 10, 10), new Rect(50, 50, 50, 60)];
+    const union = rects[0]!.union(rects[1]!);
+    expect(RectArray.from(rects).bounds.equals(union)).toBe(true);
+    expect(union.equals(new Rect(0, 0, 10, 10))).toBe(true);
+    expect(RectArray.from([new Rect(5, 5, 5, 5)]).bounds).toBe(Rect.EMPTY);
+  });
+
+  it('should transform all rects', () => {
+    const arr = RectArray.from([new Rect(0, 0, 10, 20)]);
+    const result = arr.transform(Matrix.translate(5, 5));
+    expect(result.get(0).equals(new Rect(5, 5, 15, 25))).toBe(true);
+    expect(arr.get(0).equals(new Rect(0, 0, 10, 20))).toBe(true);
+  });
+});
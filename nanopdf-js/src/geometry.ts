@@ -4,6 +4,7 @@
  * This implementation mirrors the Rust `fitz::geometry` module for 100% API compatibility.
  */
 
+import { NanoPDFError } from './types.js';
 import type { PointLike, RectLike, IRectLike, MatrixLike, QuadLike } from './types.js';
 
 // Re-export types
@@ -210,16 +211,15 @@ export class Rect implements RectLike {
 
   /** Intersection with another rectangle */
   intersect(other: RectLike): Rect {
-    const result = new Rect(
-      Math.max(this.x0, other.x0),
-      Math.max(this.y0, other.y0),
-      Math.min(this.x1, other.x1),
-      Math.min(this.y1, other.y1)
-    );
-    if (result.isEmpty) {
+    const x0 = Math.max(this.x0, other.x0);
+    const y0 = Math.max(this.y0, other.y0);
+    const x1 = Math.min(this.x1, other.x1);
+    const y1 = Math.min(this.y1, other.y1);
+    // Check emptiness before allocating so disjoint inputs cost nothing
+    if (x0 >= x1 || y0 >= y1) {
       return Rect.EMPTY;
     }
-    return result;
+    return new Rect(x0, y0, x1, y1);
   }
 
   /** Expand by including a point */
@@ -247,15 +247,29 @@ export class Rect implements RectLike {
     if (this.isEmpty || this.isInfinite) {
       return this;
     }
-    const p1 = new Point(this.x0, this.y0).transform(m);
-    const p2 = new Point(this.x1, this.y0).transform(m);
-    const p3 = new Point(this.x0, this.y1).transform(m);
-    const p4 = new Point(this.x1, this.y1).transform(m);
+    // Transform the four corners inline rather than through temporary Points
+    const { a, b, c, d, e, f } = m;
+    const ax0 = this.x0 * a;
+    const ax1 = this.x1 * a;
+    const bx0 = this.x0 * b;
+    const bx1 = this.x1 * b;
+    const cy0 = this.y0 * c;
+    const cy1 = this.y1 * c;
+    const dy0 = this.y0 * d;
+    const dy1 = this.y1 * d;
+    const px1 = ax0 + cy0 + e;
+    const px2 = ax1 + cy0 + e;
+    const px3 = ax0 + cy1 + e;
+    const px4 = ax1 + cy1 + e;
+    const py1 = bx0 + dy0 + f;
+    const py2 = bx1 + dy0 + f;
+    const py3 = bx0 + dy1 + f;
+    const py4 = bx1 + dy1 + f;
     return new Rect(
-      Math.min(p1.x, p2.x, p3.x, p4.x),
-      Math.min(p1.y, p2.y, p3.y, p4.y),
-      Math.max(p1.x, p2.x, p3.x, p4.x),
-      Math.max(p1.y, p2.y, p3.y, p4.y)
+      Math.min(px1, px2, px3, px4),
+      Math.min(py1, py2, py3, py4),
+      Math.max(px1, px2, px3, px4),
+      Math.max(py1, py2, py3, py4)
     );
   }
 
@@ -379,16 +393,15 @@ export class IRect implements IRectLike {
 
   /** Intersection with another integer rectangle */
   intersect(other: IRectLike): IRect {
-    const result = new IRect(
-      Math.max(this.x0, other.x0),
-      Math.max(this.y0, other.y0),
-      Math.min(this.x1, other.x1),
-      Math.min(this.y1, other.y1)
-    );
-    if (result.isEmpty) {
+    const x0 = Math.floor(Math.max(this.x0, other.x0));
+    const y0 = Math.floor(Math.max(this.y0, other.y0));
+    const x1 = Math.floor(Math.min(this.x1, other.x1));
+    const y1 = Math.floor(Math.min(this.y1, other.y1));
+    // Check emptiness before allocating so disjoint inputs cost nothing
+    if (x0 >= x1 || y0 >= y1) {
       return IRect.EMPTY;
     }
-    return result;
+    return new IRect(x0, y0, x1, y1);
   }
 
   /** Translate by offset */
@@ -426,6 +439,8 @@ export class Matrix implements MatrixLike {
   readonly d: number;
   readonly e: number;
   readonly f: number;
+  /** Memoized result of invert(); undefined until first computed */
+  #inverse: Matrix | null | undefined;
 
   constructor(a: number, b: number, c: number, d: number, e: number, f: number) {
     this.a = a;
@@ -457,16 +472,19 @@ export class Matrix implements MatrixLike {
 
   /** Create a translation matrix */
   static translate(tx: number, ty: number): Matrix {
+    if (tx === 0 && ty === 0) return Matrix.IDENTITY;
     return new Matrix(1, 0, 0, 1, tx, ty);
   }
 
   /** Create a scaling matrix */
   static scale(sx: number, sy: number = sx): Matrix {
+    if (sx === 1 && sy === 1) return Matrix.IDENTITY;
     return new Matrix(sx, 0, 0, sy, 0, 0);
   }
 
   /** Create a rotation matrix (degrees) */
   static rotate(degrees: number): Matrix {
+    if (degrees % 360 === 0) return Matrix.IDENTITY;
     const rad = (degrees * Math.PI) / 180;
     const cos = Math.cos(rad);
     const sin = Math.sin(rad);
@@ -475,6 +493,7 @@ export class Matrix implements MatrixLike {
 
   /** Create a shear matrix */
   static shear(sx: number, sy: number): Matrix {
+    if (sx === 0 && sy === 0) return Matrix.IDENTITY;
     return new Matrix(1, sy, sx, 1, 0, 0);
   }
 
@@ -505,6 +524,9 @@ export class Matrix implements MatrixLike {
 
   /** Concatenate with another matrix */
   concat(other: MatrixLike): Matrix {
+    // Identity operands are common in compose chains; skip the arithmetic
+    if (other === Matrix.IDENTITY) return this;
+    if (this === Matrix.IDENTITY) return Matrix.from(other);
     return new Matrix(
       this.a * other.a + this.b * other.c,
       this.a * other.b + this.b * other.d,
@@ -515,14 +537,18 @@ export class Matrix implements MatrixLike {
     );
   }
 
-  /** Invert the matrix */
+  /** Invert the matrix (computed once per instance, since matrices are immutable) */
   invert(): Matrix | null {
+    if (this.#inverse !== undefined) {
+      return this.#inverse;
+    }
     const det = this.a * this.d - this.b * this.c;
     if (Math.abs(det) < 1e-14) {
+      this.#inverse = null;
       return null;
     }
     const invDet = 1 / det;
-    return new Matrix(
+    const inverse = new Matrix(
       this.d * invDet,
       -this.b * invDet,
       -this.c * invDet,
@@ -530,6 +556,8 @@ export class Matrix implements MatrixLike {
       (this.c * this.f - this.d * this.e) * invDet,
       (this.b * this.e - this.a * this.f) * invDet
     );
+    this.#inverse = inverse;
+    return inverse;
   }
 
   /** Pre-translate this matrix */
@@ -605,6 +633,8 @@ export class Quad implements QuadLike {
   readonly ur: Point;
   readonly ll: Point;
   readonly lr: Point;
+  /** Source rect when built by fromRect, which is already the bounding box */
+  #bounds: Rect | undefined;
 
   constructor(ul: PointLike, ur: PointLike, ll: PointLike, lr: PointLike) {
     this.ul = Point.from(ul);
@@ -619,12 +649,17 @@ export class Quad implements QuadLike {
 
   /** Create a quad from a rectangle */
   static fromRect(r: RectLike): Quad {
-    return new Quad(
+    const quad = new Quad(
       new Point(r.x0, r.y0),
       new Point(r.x1, r.y0),
       new Point(r.x0, r.y1),
       new Point(r.x1, r.y1)
     );
+    // A well-ordered source Rect is already the bounding box of its corners
+    if (r instanceof Rect && r.x0 <= r.x1 && r.y0 <= r.y1) {
+      quad.#bounds = r;
+    }
+    return quad;
   }
 
   // ============================================================================
@@ -633,17 +668,17 @@ export class Quad implements QuadLike {
 
   /** Transform this quad by a matrix */
   transform(m: MatrixLike): Quad {
-    const matrix = Matrix.from(m);
     return new Quad(
-      this.ul.transform(matrix),
-      this.ur.transform(matrix),
-      this.ll.transform(matrix),
-      this.lr.transform(matrix)
+      this.ul.transform(m),
+      this.ur.transform(m),
+      this.ll.transform(m),
+      this.lr.transform(m)
     );
   }
 
   /** Get the bounding rectangle */
   get bounds(): Rect {
+    if (this.#bounds !== undefined) return this.#bounds;
     return new Rect(
       Math.min(this.ul.x, this.ur.x, this.ll.x, this.lr.x),
       Math.min(this.ul.y, this.ur.y, this.ll.y, this.lr.y),
@@ -654,32 +689,24 @@ export class Quad implements QuadLike {
 
   /** Check if a point is inside the quad */
   containsPoint(p: PointLike): boolean {
-    // Use cross product to check if point is on the correct side of each edge
-    const cross = (ax: number, ay: number, bx: number, by: number) => ax * by - ay * bx;
-
-    const check = (p1: Point, p2: Point) => {
-      return cross(p2.x - p1.x, p2.y - p1.y, p.x - p1.x, p.y - p1.y) >= 0;
-    };
-
+    // The point must be on the same side of each edge, walking the quad in order
+    const { x, y } = p;
     return (
-      check(this.ul, this.ur) &&
-      check(this.ur, this.lr) &&
-      check(this.lr, this.ll) &&
-      check(this.ll, this.ul)
+      turn(this.ul.x, this.ul.y, this.ur.x, this.ur.y, x, y) >= 0 &&
+      turn(this.ur.x, this.ur.y, this.lr.x, this.lr.y, x, y) >= 0 &&
+      turn(this.lr.x, this.lr.y, this.ll.x, this.ll.y, x, y) >= 0 &&
+      turn(this.ll.x, this.ll.y, this.ul.x, this.ul.y, x, y) >= 0
     );
   }
 
   /** Check if this is a valid quad (non-self-intersecting) */
   get isValid(): boolean {
     // A simple check: all cross products should have the same sign
-    const cross = (p1: Point, p2: Point, p3: Point) => {
-      return (p2.x - p1.x) * (p3.y - p1.y) - (p2.y - p1.y) * (p3.x - p1.x);
-    };
-
-    const c1 = cross(this.ul, this.ur, this.lr);
-    const c2 = cross(this.ur, this.lr, this.ll);
-    const c3 = cross(this.lr, this.ll, this.ul);
-    const c4 = cross(this.ll, this.ul, this.ur);
+    const { ul, ur, ll, lr } = this;
+    const c1 = turn(ul.x, ul.y, ur.x, ur.y, lr.x, lr.y);
+    const c2 = turn(ur.x, ur.y, lr.x, lr.y, ll.x, ll.y);
+    const c3 = turn(lr.x, lr.y, ll.x, ll.y, ul.x, ul.y);
+    const c4 = turn(ll.x, ll.y, ul.x, ul.y, ur.x, ur.y);
 
     return (c1 >= 0 && c2 >= 0 && c3 >= 0 && c4 >= 0) ||
            (c1 <= 0 && c2 <= 0 && c3 <= 0 && c4 <= 0);
@@ -689,3 +716,185 @@ export class Quad implements QuadLike {
     return `Quad(${this.ul}, ${this.ur}, ${this.ll}, ${this.lr})`;
   }
 }
+
+/**
+ * Cross product of (x2 - x1, y2 - y1) and (x3 - x1, y3 - y1)
+ *
+ * Positive when (x3, y3) lies to the left of the edge from (x1, y1) to
+ * (x2, y2). Shared by the Quad hit tests so they allocate nothing per call.
+ */
+function turn(x1: number, y1: number, x2: number, y2: number, x3: number, y3: number): number {
+  return (x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1);
+}
+
+/**
+ * A packed collection of rectangles
+ *
+ * Stores `[x0, y0, x1, y1]` for each rectangle in a single `Float32Array`
+ * (16 bytes per rectangle) and only creates `Rect` objects when an entry is
+ * read. Suited to the large bounding box sets produced by text extraction
+ * and search.
+ */
+export class RectArray implements Iterable<Rect> {
+  readonly data: Float32Array;
+
+  constructor(data: Float32Array) {
+    if (data.length % 4 !== 0) {
+      throw NanoPDFError.argument('RectArray data length must be a multiple of 4');
+    }
+    this.data = data;
+  }
+
+  // ============================================================================
+  // Static Constructors
+  // ============================================================================
+
+  /** Create a packed array from rect-like objects */
+  static from(rects: readonly RectLike[]): RectArray {
+    const data = new Float32Array(rects.length * 4);
+    for (let i = 0; i < rects.length; i++) {
+      const r = rects[i]!;
+      data[i * 4] = r.x0;
+      data[i * 4 + 1] = r.y0;
+      data[i * 4 + 2] = r.x1;
+      data[i * 4 + 3] = r.y1;
+    }
+    return new RectArray(data);
+  }
+
+  // ============================================================================
+  // Properties
+  // ============================================================================
+
+  /** Number of rectangles */
+  get length(): number {
+    return this.data.length / 4;
+  }
+
+  /** Bounding box of all non-empty rectangles, as Rect.union (EMPTY if there are none) */
+  get bounds(): Rect {
+    const data = this.data;
+    let x0 = Infinity;
+    let y0 = Infinity;
+    let x1 = -Infinity;
+    let y1 = -Infinity;
+    for (let i = 0; i < data.length; i += 4) {
+      const rx0 = data[i]!;
+      const ry0 = data[i + 1]!;
+      const rx1 = data[i + 2]!;
+      const ry1 = data[i + 3]!;
+      if (rx0 >= rx1 || ry0 >= ry1) {
+        continue;
+      }
+      x0 = Math.min(x0, rx0);
+      y0 = Math.min(y0, ry0);
+      x1 = Math.max(x1, rx1);
+      y1 = Math.max(y1, ry1);
+    }
+    if (x0 >= x1 || y0 >= y1) {
+      return Rect.EMPTY;
+    }
+    return new Rect(x0, y0, x1, y1);
+  }
+
+  // ============================================================================
+  // Methods
+  // ============================================================================
+
+  /** Get the rectangle at an index */
+  get(index: number): Rect {
+    if (!Number.isInteger(index) || index < 0 || index >= this.length) {
+      throw NanoPDFError.argument(`Rect index ${index} out of bounds (0..${this.length})`);
+    }
+    const i = index * 4;
+    return new Rect(this.data[i]!, this.data[i + 1]!, this.data[i + 2]!, this.data[i + 3]!);
+  }
+
+  /** Transform every rectangle by a matrix */
+  transform(m: MatrixLike): RectArray {
+    return new RectArray(transformRects(this.data, m));
+  }
+
+  /** Materialize all rectangles */
+  toArray(): Rect[] {
+    const result: Rect[] = new Array<Rect>(this.length);
+    for (let i = 0; i < result.length; i++) {
+      result[i] = this.get(i);
+    }
+    return result;
+  }
+
+  *[Symbol.iterator](): Iterator<Rect> {
+    for (let i = 0; i < this.length; i++) {
+      yield this.get(i);
+    }
+  }
+
+  toString(): string {
+    return `RectArray(${this.length})`;
+  }
+}
+
+// ============================================================================
+// Batch Operations
+// ============================================================================
+
+/**
+ * Transform a packed array of rectangles by a matrix.
+ *
+ * `rects` holds `[x0, y0, x1, y1]` for each rectangle back to back. Each
+ * rectangle is replaced by the bounding box of its transformed corners, as
+ * `Rect.transform` computes it, without creating a `Rect` per entry. Results
+ * are stored as float32, so they can differ from `Rect.transform` in the low
+ * bits (around 1e-6 relative).
+ * Writes into `out` when given (which may be `rects` itself), otherwise into
+ * a new array.
+ */
+export function transformRects(
+  rects: Float32Array,
+  m: MatrixLike,
+  out: Float32Array = new Float32Array(rects.length)
+): Float32Array {
+  if (rects.length % 4 !== 0) {
+    throw NanoPDFError.argument('rects length must be a multiple of 4');
+  }
+  if (out.length < rects.length) {
+    throw NanoPDFError.argument('out is smaller than rects');
+  }
+  const { a, b, c, d, e, f } = m;
+  for (let i = 0; i < rects.length; i += 4) {
+    const x0 = rects[i]!;
+    const y0 = rects[i + 1]!;
+    const x1 = rects[i + 2]!;
+    const y1 = rects[i + 3]!;
+    if (x0 >= x1 || y0 >= y1 || x0 === -Infinity) {
+      // Empty and infinite rectangles are unchanged by transformation
+      out[i] = x0;
+      out[i + 1] = y0;
+      out[i + 2] = x1;
+      out[i + 3] = y1;
+      continue;
+    }
+    const ax0 = x0 * a;
+    const ax1 = x1 * a;
+    const bx0 = x0 * b;
+    const bx1 = x1 * b;
+    const cy0 = y0 * c;
+    const cy1 = y1 * c;
+    const dy0 = y0 * d;
+    const dy1 = y1 * d;
+    const px1 = ax0 + cy0 + e;
+    const px2 = ax1 + cy0 + e;
+    const px3 = ax0 + cy1 + e;
+    const px4 = ax1 + cy1 + e;
+    const py1 = bx0 + dy0 + f;
+    const py2 = bx1 + dy0 + f;
+    const py3 = bx0 + dy1 + f;
+    const py4 = bx1 + dy1 + f;
+    out[i] = Math.min(px1, px2, px3, px4);
+    out[i + 1] = Math.min(py1, py2, py3, py4);
+    out[i + 2] = Math.max(px1, px2, px3, px4);
+    out[i + 3] = Math.max(py1, py2, py3, py4);
+  }
+  return out;
+}
@@ -73,7 +73,7 @@ export {
 // Geometry
 // ============================================================================
 
-export { Point, Rect, IRect, Matrix, Quad } from './geometry.js';
+export { Point, Rect, IRect, Matrix, Quad, RectArray, transformRects } from './geometry.js';
 
 // ============================================================================
 // Buffer
@@ -348,15 +348,19 @@ function createMockAddon(): NativeAddon {
     rectContains: (a: NativeRect, b: NativeRect): boolean =>
       a.x0 <= b.x0 && a.y0 <= b.y0 && a.x1 >= b.x1 && a.y1 >= b.y1,
     transformRect: (r: NativeRect, m: NativeMatrix): NativeRect => {
-      const p1 = { x: r.x0 * m.a + r.y0 * m.c + m.e, y: r.x0 * m.b + r.y0 * m.d + m.f };
-      const p2 = { x: r.x1 * m.a + r.y0 * m.c + m.e, y: r.x1 * m.b + r.y0 * m.d + m.f };
-      const p3 = { x: r.x0 * m.a + r.y1 * m.c + m.e, y: r.x0 * m.b + r.y1 * m.d + m.f };
-      const p4 = { x: r.x1 * m.a + r.y1 * m.c + m.e, y: r.x1 * m.b + r.y1 * m.d + m.f };
+      const x1 = r.x0 * m.a + r.y0 * m.c + m.e;
+      const y1 = r.x0 * m.b + r.y0 * m.d + m.f;
+      const x2 = r.x1 * m.a + r.y0 * m.c + m.e;
+      const y2 = r.x1 * m.b + r.y0 * m.d + m.f;
+      const x3 = r.x0 * m.a + r.y1 * m.c + m.e;
+      const y3 = r.x0 * m.b + r.y1 * m.d + m.f;
+      const x4 = r.x1 * m.a + r.y1 * m.c + m.e;
+      const y4 = r.x1 * m.b + r.y1 * m.d + m.f;
       return {
-        x0: Math.min(p1.x, p2.x, p3.x, p4.x),
-        y0: Math.min(p1.y, p2.y, p3.y, p4.y),
-        x1: Math.max(p1.x, p2.x, p3.x, p4.x),
-        y1: Math.max(p1.y, p2.y, p3.y, p4.y),
+        x0: Math.min(x1, x2, x3, x4),
+        y0: Math.min(y1, y2, y3, y4),
+        x1: Math.max(x1, x2, x3, x4),
+        y1: Math.max(y1, y2, y3, y4),
       };
     },
 
@@ -15,15 +15,19 @@ fn main() {
     let pkg_config_dir = Path::new(&out_dir).join("pkgconfig");
     fs::create_dir_all(&pkg_config_dir).expect("Failed to create pkgconfig directory");
 
-    // Create include directory if it doesn't exist
-    let include_dir = Path::new("include");
-    fs::create_dir_all(include_dir).expect("Failed to create include directory");
-
-    // Generate C header files for FFI
-    generate_ffi_headers();
-
-    // Generate comprehensive MuPDF-compatible headers from Rust FFI
-    generate_mupdf_headers();
+    // docs.rs builds from a read-only source tree and only needs rustdoc output,
+    // so skip writing headers there (and spawning the Python generator)
+    if env::var_os("DOCS_RS").is_none() {
+        // Create include directory if it doesn't exist
+        let include_dir = Path::new("include");
+        fs::create_dir_all(include_dir).expect("Failed to create include directory");
+
+        // Generate C header files for FFI
+        generate_ffi_headers();
+
+        // Generate comprehensive MuPDF-compatible headers from Rust FFI
+        generate_mupdf_headers();
+    }
 
     // Generate nanopdf.pc
     generate_pkg_config(
@@ -46,6 +50,7 @@ fn main() {
     println!("cargo:rerun-if-changed=build.rs");
     println!("cargo:rerun-if-changed=src/ffi/");
     println!("cargo:rerun-if-changed=scripts/generate_headers.py");
+    println!("cargo:rerun-if-env-changed=DOCS_RS");
 }
 
 fn generate_ffi_headers() {
@@ -158,8 +163,7 @@ typedef int32_t Handle;
 #endif /* NANOPDF_H */
 "#;
 
-    fs::write("include/nanopdf.h", nanopdf_header).expect("Failed to write nanopdf.h");
-    println!("Generated: include/nanopdf.h");
+    write_if_changed(Path::new("include/nanopdf.h"), nanopdf_header);
 
     // Generate mupdf-ffi.h - MuPDF compatibility header
     let mupdf_ffi_header = r#"/**
@@ -203,8 +207,7 @@ typedef int32_t Handle;
 #endif /* MUPDF_FFI_H */
 "#;
 
-    fs::write("include/mupdf-ffi.h", mupdf_ffi_header).expect("Failed to write mupdf-ffi.h");
-    println!("Generated: include/mupdf-ffi.h");
+    write_if_changed(Path::new("include/mupdf-ffi.h"), mupdf_ffi_header);
 }
 
 fn generate_mupdf_headers() {
@@ -247,8 +250,18 @@ fn generate_pkg_config(template: &str, output: &Path, version: &str, prefix: &st
         .replace("@VERSION@", version)
         .replace("@PREFIX@", prefix);
 
-    fs::write(output, content)
-        .unwrap_or_else(|_| panic!("Failed to write pkg-config file: {}", output.display()));
+    write_if_changed(output, &content);
+}
 
-    println!("Generated: {}", output.display());
+/// Write `content` to `path` unless the file already holds exactly that content.
+///
+/// Rewriting an identical header still bumps its mtime, which makes every C
+/// consumer that includes it rebuild.
+fn write_if_changed(path: &Path, content: &str) {
+    if fs::read_to_string(path).is_ok_and(|existing| existing == content) {
+        println!("Unchanged: {}", path.display());
+        return;
+    }
+    fs::write(path, content).unwrap_or_else(|_| panic!("Failed to write {}", path.display()));
+    println!("Generated: {}", path.display());
 }
@@ -201,6 +201,24 @@ def extract_ffi_functions(file_path: Path) -> List[Dict]:
 
     return functions
 
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content.
+
+    Rewriting an identical header still bumps its mtime, which makes every C
+    consumer that includes it rebuild. Returns True if the file was written.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+    return True
+
+def report_write(path: Path, written: bool):
+    """Print the outcome of a write_if_changed call."""
+    print(f"  {'Generated' if written else 'Unchanged'}: {path}")
+
 def generate_module_header(module_name: str, functions: List[Dict], is_pdf: bool = False) -> str:
     """Generate a C header file for a module."""
     prefix = 'pdf' if is_pdf else 'fitz'
@@ -351,10 +369,7 @@ def main():
 
         header_file = include_dir / subdir / f'{module}.h'
 
-        with open(header_file, 'w') as f:
-            f.write(header_content)
-
-        print(f"  Generated: {header_file}")
+        report_write(header_file, write_if_changed(header_file, header_content))
 
     # Generate master headers
     generate_master_headers(include_dir, list(all_functions.keys()), fitz_modules, pdf_modules)
@@ -392,9 +407,7 @@ extern "C" {
 #endif /* MUPDF_FITZ_H */
 """
 
-    with open(include_dir / 'fitz.h', 'w') as f:
-        f.write(fitz_header)
-    print(f"  Generated: {include_dir / 'fitz.h'}")
+    report_write(include_dir / 'fitz.h', write_if_changed(include_dir / 'fitz.h', fitz_header))
 
     # Generate pdf.h
     pdf_header = """// NanoPDF - MuPDF API Compatible C Header
@@ -423,9 +436,7 @@ extern "C" {
 #endif /* MUPDF_PDF_H */
 """
 
-    with open(include_dir / 'pdf.h', 'w') as f:
-        f.write(pdf_header)
-    print(f"  Generated: {include_dir / 'pdf.h'}")
+    report_write(include_dir / 'pdf.h', write_if_changed(include_dir / 'pdf.h', pdf_header))
 
     # Generate mupdf.h
     mupdf_header = """// NanoPDF - MuPDF API Compatible C Header
@@ -440,9 +451,8 @@ extern "C" {
 #endif /* MUPDF_H */
 """
 
-    with open(Path('include') / 'mupdf.h', 'w') as f:
-        f.write(mupdf_header)
-    print(f"  Generated: include/mupdf.h")
+    mupdf_path = Path('include') / 'mupdf.h'
+    report_write(mupdf_path, write_if_changed(mupdf_path, mupdf_header))
 
 if __name__ == '__main__':
     main()
@@ -27,7 +27,7 @@ pub struct fz_rect {
 
 /// fz_irect - Integer rectangle
 #[repr(C)]
-#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq, Hash)]
 pub struct fz_irect {
     pub x0: i32,
     pub y0: i32,
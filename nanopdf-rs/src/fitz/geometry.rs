@@ -1,6 +1,11 @@
 //! Geometry primitives - Point, Rect, Matrix, Quad
+//!
+//! All types are `#[repr(C)]` so they share the layout of the corresponding
+//! `fz_*` FFI structs and pack tightly in slices of bounding boxes.
+//! Only the larger per-glyph methods are `#[inline]`; rustc inlines the rest itself.
 
 #[derive(Debug, Clone, Copy, PartialEq, Default)]
+#[repr(C)]
 pub struct Point {
     pub x: f32,
     pub y: f32,
@@ -20,6 +25,7 @@ impl Point {
 }
 
 #[derive(Debug, Clone, Copy, PartialEq, Default)]
+#[repr(C)]
 pub struct Rect {
     pub x0: f32,
     pub y0: f32,
@@ -99,28 +105,39 @@ impl Rect {
     }
 
     /// Transform rectangle by a matrix
+    #[inline]
     pub fn transform(&self, m: &Matrix) -> Rect {
         if self.is_empty() {
             return *self;
         }
 
-        // Transform all four corners
-        let p0 = Point::new(self.x0, self.y0).transform(m);
-        let p1 = Point::new(self.x1, self.y0).transform(m);
-        let p2 = Point::new(self.x0, self.y1).transform(m);
-        let p3 = Point::new(self.x1, self.y1).transform(m);
-
-        // Find bounding box
-        let mut result = Rect::EMPTY;
-        result.include_point(p0);
-        result.include_point(p1);
-        result.include_point(p2);
-        result.include_point(p3);
-        result
+        // Transform all four corners, sharing the per-coordinate products
+        let (ax0, ax1) = (self.x0 * m.a, self.x1 * m.a);
+        let (bx0, bx1) = (self.x0 * m.b, self.x1 * m.b);
+        let (cy0, cy1) = (self.y0 * m.c, self.y1 * m.c);
+        let (dy0, dy1) = (self.y0 * m.d, self.y1 * m.d);
+        let x00 = ax0 + cy0 + m.e;
+        let x10 = ax1 + cy0 + m.e;
+        let x01 = ax0 + cy1 + m.e;
+        let x11 = ax1 + cy1 + m.e;
+        let y00 = bx0 + dy0 + m.f;
+        let y10 = bx1 + dy0 + m.f;
+        let y01 = bx0 + dy1 + m.f;
+        let y11 = bx1 + dy1 + m.f;
+
+        // Find bounding box with independent min/max pairs rather than a
+        // sequential include_point chain
+        Rect {
+            x0: x00.min(x10).min(x01.min(x11)),
+            y0: y00.min(y10).min(y01.min(y11)),
+            x1: x00.max(x10).max(x01.max(x11)),
+            y1: y00.max(y10).max(y01.max(y11)),
+        }
     }
 }
 
-#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Default)]
+#[repr(C)]
 pub struct IRect {
     pub x0: i32,
     pub y0: i32,
@@ -155,6 +172,7 @@ impl From<Rect> for IRect {
 }
 
 #[derive(Debug, Clone, Copy, PartialEq)]
+#[repr(C)]
 pub struct Matrix {
     pub a: f32,
     pub b: f32,
@@ -215,6 +233,7 @@ impl Matrix {
             f: 0.0,
         }
     }
+    #[inline]
     pub fn concat(&self, m: &Matrix) -> Self {
         Self {
             a: self.a * m.a + self.b * m.c,
@@ -228,6 +247,7 @@ impl Matrix {
 }
 
 #[derive(Debug, Clone, Copy, PartialEq, Default)]
+#[repr(C)]
 pub struct Quad {
     pub ul: Point,
     pub ur: Point,
@@ -244,6 +264,7 @@ impl Quad {
             lr: Point::new(r.x1, r.y1),
         }
     }
+    #[inline]
     pub fn transform(&self, m: &Matrix) -> Self {
         Self {
             ul: self.ul.transform(m),
@@ -381,6 +402,25 @@ mod tests {
         assert_eq!(r.y1, 10.0);
     }
 
+    #[test]
+    fn test_rect_transform_matches_corners() {
+        let r = Rect::new(1.0, 2.0, 7.0, 5.0);
+        let m = Matrix::rotate(30.0).concat(&Matrix::translate(3.0, -4.0));
+        let t = r.transform(&m);
+
+        let mut expected = Rect::EMPTY;
+        for (x, y) in [(r.x0, r.y0), (r.x1, r.y0), (r.x0, r.y1), (r.x1, r.y1)] {
+            expected.include_point(Point::new(x, y).transform(&m));
+        }
+        assert_eq!(t, expected);
+    }
+
+    #[test]
+    fn test_rect_transform_empty() {
+        let r = Rect::new(10.0, 10.0, 5.0, 5.0);
+        assert_eq!(r.transform(&Matrix::translate(1.0, 1.0)), r);
+    }
+
     #[test]
     fn test_rect_constants() {
         assert!(Rect::EMPTY.is_empty());
@@ -423,6 +463,20 @@ mod tests {
         assert_eq!(ir.y1, 20);
     }
 
+    #[test]
+    fn test_irect_hash_dedup() {
+        use std::collections::HashSet;
+
+        let boxes = [
+            Rect::new(0.2, 0.2, 9.8, 9.8),
+            Rect::new(0.7, 0.1, 9.1, 9.9),
+            Rect::new(20.0, 0.0, 30.0, 10.0),
+        ];
+        let unique: HashSet<IRect> = boxes.iter().map(|&r| IRect::from(r)).collect();
+        assert_eq!(unique.len(), 2);
+        assert!(unique.contains(&IRect::new(0, 0, 10, 10)));
+    }
+
     // Matrix tests
     #[test]
     fn test_matrix_identity() {
@@ -498,6 +552,32 @@ mod tests {
         assert_eq!(m, Matrix::IDENTITY);
     }
 
+    // Layout tests
+    #[test]
+    fn test_layout_matches_ffi() {
+        use crate::ffi::geometry::{fz_irect, fz_matrix, fz_point, fz_quad, fz_rect};
+        use std::mem::{align_of, size_of};
+
+        assert_eq!(size_of::<Point>(), size_of::<fz_point>());
+        assert_eq!(size_of::<Rect>(), size_of::<fz_rect>());
+        assert_eq!(size_of::<IRect>(), size_of::<fz_irect>());
+        assert_eq!(size_of::<Matrix>(), size_of::<fz_matrix>());
+        assert_eq!(size_of::<Quad>(), size_of::<fz_quad>());
+        assert_eq!(align_of::<Rect>(), align_of::<fz_rect>());
+    }
+
+    #[test]
+    fn test_layout_is_packed() {
+        use std::mem::size_of;
+
+        assert_eq!(size_of::<Point>(), 8);
+        assert_eq!(size_of::<Rect>(), 16);
+        assert_eq!(size_of::<IRect>(), 16);
+        assert_eq!(size_of::<Matrix>(), 24);
+        assert_eq!(size_of::<Quad>(), 32);
+        assert_eq!(size_of::<[Rect; 4]>(), 64);
+    }
+
     // Quad tests
     #[test]
     fn test_quad_from_rect() {
@@ -21,6 +21,10 @@
 //! inspired by pypdf and other Python PDF libraries. This includes document
 //! creation, advanced page manipulation, watermarking, optimization, and more.
 
+// Source pages are opt-in via `--cfg nanopdf_docs_full`; docs.rs enables them
+// (see Cargo.toml). Locally: `RUSTDOCFLAGS="--cfg nanopdf_docs_full" cargo doc`
+#![cfg_attr(not(nanopdf_docs_full), doc(html_no_source))]
+
 pub mod enhanced;
 pub mod ffi;
 pub mod fitz;